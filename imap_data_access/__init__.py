@@ -80,38 +80,42 @@ WEBPODA_TOKEN : This is the token used to authenticate with the webpoda API.
 
 # NOTE: ialirt and spacecraft aren't actual instruments, but they are
 #       additional data sources for packet definitions and processing
-VALID_INSTRUMENTS = {
-    "codice",
-    "glows",
-    "hit",
-    "hi",
-    "ialirt",
-    "idex",
-    "lo",
-    "mag",
-    "spacecraft",
-    "swapi",
-    "swe",
-    "ultra",
-}
+VALID_INSTRUMENTS = frozenset(
+    {
+        "codice",
+        "glows",
+        "hit",
+        "hi",
+        "ialirt",
+        "idex",
+        "lo",
+        "mag",
+        "spacecraft",
+        "swapi",
+        "swe",
+        "ultra",
+    }
+)
 
-VALID_DATALEVELS = {
-    "l0",
-    "l1",
-    "l1a",
-    "l1b",
-    "l1c",
-    "l1ca",
-    "l1cb",
-    "l1d",
-    "l2",
-    "l2a",
-    "l2b",
-    "l2c",
-    "l3",
-    "l3a",
-    "l3b",
-    "l3c",
-    "l3d",
-    "l3e",
-}
+VALID_DATALEVELS = frozenset(
+    {
+        "l0",
+        "l1",
+        "l1a",
+        "l1b",
+        "l1c",
+        "l1ca",
+        "l1cb",
+        "l1d",
+        "l2",
+        "l2a",
+        "l2b",
+        "l2c",
+        "l3",
+        "l3a",
+        "l3b",
+        "l3c",
+        "l3d",
+        "l3e",
+    }
+)
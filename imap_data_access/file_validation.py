@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import calendar
 import re
 import typing
 import warnings
@@ -12,6 +13,25 @@ from pathlib import Path
 
 import imap_data_access
 
+# Filenames are plain ASCII, so \d only needs to match the ASCII digits
+_SCIENCE_FILENAME_REGEX = re.compile(
+    r"^(?P<mission>imap)_"
+    r"(?P<instrument>[^_]+)_"
+    r"(?P<data_level>[^_]+)_"
+    r"(?P<descriptor>[^_]+)_"
+    # The year and month are captured separately for building the directory path
+    r"(?P<start_date>(?P<start_year>\d{4})(?P<start_month>\d{2})\d{2})"
+    # Optional repointing/CR field
+    r"(-(?P<interval_type>(?:repoint|cr))(?P<interval>\d{5}))?"
+    r"_(?P<version>v\d{3})"
+    r"\.(?P<extension>[^.]+)$",
+    re.ASCII,
+)
+_REPOINTING_REGEX = re.compile(r"repoint\d{5}", re.ASCII)
+_CR_REGEX = re.compile(r"cr\d{5}", re.ASCII)
+# Number of days in each month of a non-leap year
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
 
 def generate_imap_file_path(filename: str) -> ImapFilePath:
     """Generate an ImapFilePath object from a filename.
@@ -84,14 +104,39 @@ class ImapFilePath:
         bool
             Whether date input is valid or not
         """
-        # Validate if it's a real date
-        try:
-            # This checks if date is in YYYYMMDD format.
-            # Sometimes, date is correct but not in the format we want
-            datetime.strptime(input_date, "%Y%m%d")
-            return True
-        except ValueError:
+        # This checks if date is in YYYYMMDD format without building a datetime,
+        # which is expensive when validating many filenames
+        if len(input_date) != 8 or not (input_date.isascii() and input_date.isdigit()):
             return False
+        return ImapFilePath._is_real_date(input_date)
+
+    @staticmethod
+    def _is_real_date(input_date: str) -> bool:
+        """Check that an 8 digit YYYYMMDD string is a real calendar date.
+
+        The format itself is not checked, so this should only be used on strings
+        that are already known to be 8 digits, such as dates matched by a filename
+        regex.
+
+        Parameters
+        ----------
+        input_date : str
+            Date in YYYYMMDD format.
+
+        Returns
+        -------
+        bool
+            Whether the date exists or not
+        """
+        year = int(input_date[:4])
+        month = int(input_date[4:6])
+        day = int(input_date[6:])
+        if year < 1 or not 1 <= month <= 12:
+            return False
+        days_in_month = _DAYS_IN_MONTH[month - 1]
+        if month == 2 and calendar.isleap(year):
+            days_in_month += 1
+        return 1 <= day <= days_in_month
 
     @staticmethod
     def is_valid_version(input_version: str) -> bool:
@@ -107,7 +152,17 @@ class ImapFilePath:
         bool
             Whether input version is valid or not.
         """
-        return input_version == "latest" or re.fullmatch(r"v\d{3}", input_version)
+        if input_version == "latest":
+            return True
+        # The version is short and fixed width, so check the characters directly
+        # rather than running a regex
+        digits = input_version[1:]
+        return (
+            len(input_version) == 4
+            and input_version[0] == "v"
+            and digits.isascii()
+            and digits.isdigit()
+        )
 
     @abstractmethod
     def construct_path(self) -> Path:
@@ -127,7 +182,7 @@ class ScienceFilePath(ImapFilePath):
         "<mission>_<instrument>_<datalevel>_<descriptor>_"
         "<startdate>(-<repointing>)_<version>.<extension>"
     )
-    VALID_EXTENSIONS: typing.ClassVar[set[str]] = {"cdf", "pkts"}
+    VALID_EXTENSIONS: typing.ClassVar[frozenset[str]] = frozenset({"cdf", "pkts"})
     _dir_prefix = "imap"
 
     class InvalidScienceFileError(ImapFilePath.InvalidImapFileError):
@@ -179,6 +234,8 @@ class ScienceFilePath(ImapFilePath):
         self.data_level = split_filename["data_level"]
         self.descriptor = split_filename["descriptor"]
         self.start_date = split_filename["start_date"]
+        self.start_year = split_filename["start_year"]
+        self.start_month = split_filename["start_month"]
         self.repointing = split_filename["repointing"]
         self.cr = split_filename["cr"]
         self.version = split_filename["version"]
@@ -188,6 +245,14 @@ class ScienceFilePath(ImapFilePath):
         if self.error_message:
             raise self.InvalidImapFileError(f"{self.error_message}")
 
+        # The path relative to the data directory only depends on the filename, so
+        # build it once here. The data directory itself is looked up in
+        # construct_path because the configuration can change after initialization.
+        self._relative_path = Path(
+            f"{self._dir_prefix}/{self.instrument}/{self.data_level}/"
+            f"{self.start_year}/{self.start_month}/{self.filename}"
+        )
+
     @classmethod
     def generate_from_inputs(
         cls,
@@ -271,48 +336,28 @@ class ScienceFilePath(ImapFilePath):
         """
         error_message = ""
 
-        if any(
-            attr is None or attr == ""
-            for attr in [
-                self.mission,
-                self.instrument,
-                self.data_level,
-                self.descriptor,
-                self.start_date,
-                self.version,
-                self.extension,
-            ]
-        ):
-            error_message = (
-                f"Invalid filename, missing attribute. Filename "
-                f"convention is {ScienceFilePath.FILENAME_CONVENTION} \n"
-            )
-        if self.mission != "imap":
-            error_message += f"Invalid mission {self.mission}. Please use imap \n"
-
+        # The filename regex already guarantees that every attribute is present and
+        # that the mission, version, and repointing are well formed, so only the
+        # values it can't constrain are checked here.
         if self.instrument not in imap_data_access.VALID_INSTRUMENTS:
             error_message += (
                 f"Invalid instrument {self.instrument}. Please choose "
                 f"from "
-                f"{imap_data_access.VALID_INSTRUMENTS} \n"
+                f"{', '.join(sorted(imap_data_access.VALID_INSTRUMENTS))} \n"
             )
         if self.data_level not in imap_data_access.VALID_DATALEVELS:
             error_message += (
                 f"Invalid data level {self.data_level}. Please choose "
                 f"from "
-                f"{imap_data_access.VALID_DATALEVELS} \n"
+                f"{', '.join(sorted(imap_data_access.VALID_DATALEVELS))} \n"
             )
-        if not self.is_valid_date(self.start_date):
+        if not self._is_real_date(self.start_date):
             error_message += "Invalid start date format. Please use YYYYMMDD format. \n"
-        if not bool(re.match(r"^v\d{3}$", self.version)):
-            error_message += "Invalid version format. Please use vXXX format. \n"
-        if self.repointing and not isinstance(self.repointing, int):
-            error_message += "The repointing number should be an integer.\n"
 
         if self.extension not in self.VALID_EXTENSIONS:
             error_message += (
                 f"Invalid extension. Extension should be one of "
-                f"{self.VALID_EXTENSIONS}\n"
+                f"{', '.join(sorted(self.VALID_EXTENSIONS))}\n"
             )
 
         return error_message
@@ -330,20 +375,15 @@ class ScienceFilePath(ImapFilePath):
         Path
             Upload path
         """
-        upload_path = Path(
-            f"{self._dir_prefix}/{self.instrument}/{self.data_level}/"
-            f"{self.start_date[:4]}/{self.start_date[4:6]}/{self.filename}"
-        )
-
-        return imap_data_access.config["DATA_DIR"] / upload_path
+        return imap_data_access.config["DATA_DIR"] / self._relative_path
 
     @staticmethod
     def extract_filename_components(filename: str | Path) -> dict:
         """Extract all components from filename. Does not validate instrument or level.
 
         Will return a dictionary with the following keys:
-        { instrument, datalevel, descriptor, startdate, enddate, version, extension, cr,
-        repointing }
+        { instrument, datalevel, descriptor, startdate, start_year, start_month,
+        version, extension, cr, repointing }
 
         If a match is not found, a ValueError will be raised.
 
@@ -360,21 +400,10 @@ class ScienceFilePath(ImapFilePath):
         components : dict
             Dictionary containing components.
         """
-        pattern = (
-            r"^(?P<mission>imap)_"
-            r"(?P<instrument>[^_]+)_"
-            r"(?P<data_level>[^_]+)_"
-            r"(?P<descriptor>[^_]+)_"
-            r"(?P<start_date>\d{8})"
-            # Optional repointing/CR field
-            r"(-(?P<interval_type>(?:repoint|cr))(?P<interval>\d{5}))?"
-            r"_(?P<version>v\d{3})"
-            r"\.(?P<extension>[^.]+)$"
-        )
-        if isinstance(filename, Path):
-            filename = filename.name
+        # Path objects are reduced to their name, strings are used as-is
+        filename = getattr(filename, "name", filename)
 
-        match = re.match(pattern, filename)
+        match = _SCIENCE_FILENAME_REGEX.match(filename)
         if match is None:
             raise ScienceFilePath.InvalidImapFileError(
                 f"Filename {filename} does not match expected pattern: "
@@ -414,7 +443,7 @@ class ScienceFilePath(ImapFilePath):
         bool
             Whether input repointing is valid or not.
         """
-        return re.fullmatch(r"repoint\d{5}", str(input_repointing))
+        return _REPOINTING_REGEX.fullmatch(str(input_repointing))
 
     def is_valid_for_start_date(self, start_date: datetime) -> bool:
         """Check if the file is valid for the given science file start_date.
@@ -448,7 +477,7 @@ class ScienceFilePath(ImapFilePath):
         bool
             Whether input carrington rotation is valid or not.
         """
-        return re.fullmatch(r"cr\d{5}", str(input_cr))
+        return _CR_REGEX.fullmatch(str(input_cr))
 
 
 # Transform the suffix to the directory structure we are using
@@ -793,7 +822,9 @@ class AncillaryFilePath(ImapFilePath):
         "<mission>_<instrument>_<description>_"
         "<start_date>(_<end_date>)_<version>.<extension>"
     )
-    VALID_EXTENSIONS: typing.ClassVar[set[str]] = {"cdf", "csv", "dat", "json", "zip"}
+    VALID_EXTENSIONS: typing.ClassVar[frozenset[str]] = frozenset(
+        {"cdf", "csv", "dat", "json", "zip"}
+    )
     _dir_prefix = "imap/ancillary"
 
     class InvalidAncillaryFileError(ImapFilePath.InvalidImapFileError):
@@ -919,40 +950,26 @@ class AncillaryFilePath(ImapFilePath):
         """
         error_message = ""
 
-        if any(
-            attr is None or attr == ""
-            for attr in [
-                self.mission,
-                self.instrument,
-                self.descriptor,
-                self.version,
-                self.extension,
-            ]
-        ):
-            error_message = (
-                f"Invalid filename, missing attribute. Filename "
-                f"convention is {AncillaryFilePath.FILENAME_CONVENTION} \n"
-            )
-        if self.mission != "imap":
-            error_message += f"Invalid mission {self.mission}. Please use imap \n"
-
+        # The filename regex already guarantees that every attribute is present and
+        # that the mission and version are well formed, so only the values it can't
+        # constrain are checked here.
         if self.instrument not in imap_data_access.VALID_INSTRUMENTS:
             error_message += (
                 f"Invalid instrument {self.instrument}. Please choose from "
-                f"{imap_data_access.VALID_INSTRUMENTS} \n"
+                f"{', '.join(sorted(imap_data_access.VALID_INSTRUMENTS))} \n"
             )
 
         if self.extension not in self.VALID_EXTENSIONS:
             error_message += (
                 f"Invalid extension. Extension should be one of "
-                f"{self.VALID_EXTENSIONS}.\n"
+                f"{', '.join(sorted(self.VALID_EXTENSIONS))}.\n"
             )
 
-        if not ScienceFilePath.is_valid_date(self.start_date):
+        if not self._is_real_date(self.start_date):
             error_message += "Invalid start date format. Please use YYYYMMDD format. \n"
 
         if self.end_date:
-            if not ScienceFilePath.is_valid_date(self.end_date):
+            if not self._is_real_date(self.end_date):
                 error_message += (
                     "Invalid end date format. Please use YYYYMMDD format. \n"
                 )
@@ -997,23 +1014,10 @@ class AncillaryFilePath(ImapFilePath):
         components : dict
             Dictionary containing components.
         """
-        # Pipe these together for optional matching in the regex below
-        extension_regex = "|".join(
-            AncillaryFilePath.VALID_EXTENSIONS.union(QuicklookFilePath.VALID_EXTENSIONS)
-        )
-        pattern = (
-            r"^(?P<mission>imap)_"
-            r"(?P<instrument>[^_]+)_"
-            r"(?P<descriptor>[^_]+)_"
-            r"(?P<start_date>\d{8})"
-            r"(_(?P<end_date>\d{8}))?"  # Optional end_date
-            r"_(?P<version>v\d{3})"
-            rf"\.(?P<extension>{extension_regex})$"
-        )
-        if isinstance(filename, Path):
-            filename = filename.name
+        # Path objects are reduced to their name, strings are used as-is
+        filename = getattr(filename, "name", filename)
 
-        match = re.match(pattern, filename)
+        match = _ANCILLARY_FILENAME_REGEX.match(filename)
         if match is None:
             raise AncillaryFilePath.InvalidImapFileError(
                 f"Filename {filename} does not match expected pattern: "
@@ -1052,7 +1056,7 @@ class AncillaryFilePath(ImapFilePath):
 class QuicklookFilePath(ScienceFilePath):
     """Class for building and validating filepaths for Quicklook files."""
 
-    VALID_EXTENSIONS: typing.ClassVar[set[str]] = {"jpg", "pdf", "png"}
+    VALID_EXTENSIONS: typing.ClassVar[frozenset[str]] = frozenset({"jpg", "pdf", "png"})
     _dir_prefix = "imap/quicklook"
 
 
@@ -1065,5 +1069,23 @@ class CadenceFilePath(ScienceFilePath):
     remains compatible with what ProcessingInputCollection expects.
     """
 
-    VALID_EXTENSIONS: typing.ClassVar[set[str]] = {"json"}
+    VALID_EXTENSIONS: typing.ClassVar[frozenset[str]] = frozenset({"json"})
     _dir_prefix = "imap/cadence"
+
+
+# The ancillary pattern also accepts the quicklook extensions, so it can only be
+# compiled once QuicklookFilePath is defined. Pipe these together for optional
+# matching in the regex below.
+_ancillary_extension_regex = "|".join(
+    AncillaryFilePath.VALID_EXTENSIONS.union(QuicklookFilePath.VALID_EXTENSIONS)
+)
+_ANCILLARY_FILENAME_REGEX = re.compile(
+    r"^(?P<mission>imap)_"
+    r"(?P<instrument>[^_]+)_"
+    r"(?P<descriptor>[^_]+)_"
+    r"(?P<start_date>\d{8})"
+    r"(_(?P<end_date>\d{8}))?"  # Optional end_date
+    r"_(?P<version>v\d{3})"
+    rf"\.(?P<extension>{_ancillary_extension_regex})$",
+    re.ASCII,
+)
@@ -222,7 +222,8 @@ def query(
     # check extension
     if extension is not None and extension not in ScienceFilePath.VALID_EXTENSIONS:
         raise ValueError(
-            f"Not a valid extension, choose from {ScienceFilePath.VALID_EXTENSIONS}."
+            "Not a valid extension, choose from "
+            f"{', '.join(sorted(ScienceFilePath.VALID_EXTENSIONS))}."
         )
 
     url = f"{imap_data_access.config['DATA_ACCESS_URL']}/query"
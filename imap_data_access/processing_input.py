@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import json
-from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from abc import abstractmethod
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -46,6 +46,31 @@ def generate_imap_input(filename: str) -> ProcessingInput:
     )
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_file_path(
+    file_path_class: type[ImapFilePath], filename: str
+) -> ImapFilePath:
+    """Create an ImapFilePath from a filename, caching the result.
+
+    The same filenames often appear in several ProcessingInputs, so repeated parses
+    return the already validated object. ImapFilePath objects are not modified
+    after initialization, which makes them safe to share.
+
+    Parameters
+    ----------
+    file_path_class : type[ImapFilePath]
+        The ImapFilePath subclass used to parse the filename.
+    filename : str
+        The filename to parse.
+
+    Returns
+    -------
+    ImapFilePath
+        The parsed file path object.
+    """
+    return file_path_class(filename)
+
+
 class ProcessingInputType(Enum):
     """Enum matching types of ProcessingInputs to output strings describing them."""
 
@@ -54,14 +79,6 @@ class ProcessingInputType(Enum):
     SPICE_FILE = "spice"
 
 
-class InputTypePathMapper(Enum):
-    """Enum matching ProcessingInput names to classes."""
-
-    SCIENCE_FILE = ScienceFilePath
-    ANCILLARY_FILE = AncillaryFilePath
-    SPICE_FILE = SPICEFilePath
-
-
 class SPICESource(Enum):
     """Enum matching source of SPICE file types."""
 
@@ -70,8 +87,7 @@ class SPICESource(Enum):
     REPOINT = "repoint"
 
 
-@dataclass
-class ProcessingInput(ABC):
+class ProcessingInput:
     """Interface for input file management and serialization.
 
     ProcessingInput is an abstract class that is used to manage input files for
@@ -110,14 +126,25 @@ class ProcessingInput(ABC):
         spin and repoint file types, descriptor 'historical' or predict.
     """
 
-    filename_list: list[str] = None
-    imap_file_paths: list[ImapFilePath] = None
-    input_type: ProcessingInputType = None
+    filename_list: list[str]
+    imap_file_paths: list[ImapFilePath]
+    input_type: ProcessingInputType
     # Following three are retrieved from dependency check.
     # But they can also come from the filename.
-    source: str = field(init=False)
-    data_type: str = field(init=False)  # should be data level or "ancillary" or "spice"
-    descriptor: str = field(init=False)
+    source: str
+    data_type: str  # should be data level or "ancillary" or "spice"
+    descriptor: str
+
+    # Collections can hold many inputs, so skip the per-instance __dict__. The SPICE
+    # subclasses keep one because they override some of these with class defaults.
+    __slots__ = (
+        "data_type",
+        "descriptor",
+        "filename_list",
+        "imap_file_paths",
+        "input_type",
+        "source",
+    )
 
     class ProcessingInputError(Exception):
         """Indicate that the ProcessingInput is invalid."""
@@ -136,18 +163,14 @@ class ProcessingInput(ABC):
         args: str
             Filenames (not paths), as strings.
         """
-        self.filename_list = []
-        for filename in args:
-            if not isinstance(filename, str):
-                raise ProcessingInput.ProcessingInputError(
-                    "All arguments must be strings"
-                )
-            self.filename_list.append(filename)
-        self._set_attributes_from_filenames()
         if len(args) < 1:
             raise ProcessingInput.ProcessingInputError(
                 "At least one file must be provided."
             )
+        if not all(isinstance(filename, str) for filename in args):
+            raise ProcessingInput.ProcessingInputError("All arguments must be strings")
+        self.filename_list = list(args)
+        self._set_attributes_from_filenames()
 
     @abstractmethod
     def get_time_range(self):
@@ -171,33 +194,37 @@ class ProcessingInput(ABC):
 
         This method is called by the constructor and can be overridden by subclasses.
         It works for ScienceFilePaths and AncillaryFilePaths, but not SPICEFilePaths.
+        Subclasses using it should set _file_path_class to the ImapFilePath class
+        used to parse their filenames.
 
         This sets source, datatype, descriptor, and file_obj_list attributes.
         """
         # For science and ancillary files
-        source = set()
-        data_type = set()
-        descriptor = set()
-        file_obj_list = []
-        for file in self.filename_list:
-            path_validator = InputTypePathMapper[self.input_type.name].value(file)
-
-            source.add(path_validator.instrument)
-            if self.input_type == ProcessingInputType.SCIENCE_FILE:
-                data_type.add(path_validator.data_level)
-            else:
-                data_type.add(self.input_type.value)
-            descriptor.add(path_validator.descriptor)
-            file_obj_list.append(path_validator)
+        file_path_class = self._file_path_class
+        file_obj_list = [
+            _parse_file_path(file_path_class, file) for file in self.filename_list
+        ]
 
-        if len(source) != 1 or len(data_type) != 1 or len(descriptor) != 1:
-            raise ProcessingInput.ProcessingInputError(
-                "All files must have the same source, data type, and descriptor."
-            )
+        # Compare every file against the first one rather than collecting the
+        # attributes into sets
+        first_file = file_obj_list[0]
+        is_science = self.input_type == ProcessingInputType.SCIENCE_FILE
+        for path_validator in file_obj_list[1:]:
+            if (
+                path_validator.instrument != first_file.instrument
+                or path_validator.descriptor != first_file.descriptor
+                or (is_science and path_validator.data_level != first_file.data_level)
+            ):
+                raise ProcessingInput.ProcessingInputError(
+                    "All files must have the same source, data type, and descriptor."
+                )
 
-        self.source = source.pop()
-        self.data_type = data_type.pop()
-        self.descriptor = descriptor.pop()
+        self.source = first_file.instrument
+        if is_science:
+            self.data_type = first_file.data_level
+        else:
+            self.data_type = self.input_type.value
+        self.descriptor = first_file.descriptor
         self.imap_file_paths = file_obj_list
 
     def construct_json_output(self):
@@ -216,6 +243,9 @@ class ScienceInput(ProcessingInput):
      and descriptor.
     """
 
+    __slots__ = ()
+    _file_path_class = ScienceFilePath
+
     def __init__(self, *args):
         """Set the processing type to ScienceFile and then calls super().
 
@@ -240,15 +270,12 @@ class ScienceInput(ProcessingInput):
         """
         # TODO: Add repointing time calculation here
         # files are currently assumed to cover exactly 24 hours.
-        start_time = None
-        end_time = None
-        for file in self.filename_list:
-            filepath = ScienceFilePath(file)
-            date = datetime.strptime(filepath.start_date, "%Y%m%d")
-            if start_time is None or date < start_time:
-                start_time = date
-            if end_time is None or date > end_time:
-                end_time = date
+        # YYYYMMDD strings sort in date order, so only the earliest and latest
+        # dates need to be converted to datetimes
+        start_date = min(filepath.start_date for filepath in self.imap_file_paths)
+        end_date = max(filepath.start_date for filepath in self.imap_file_paths)
+        start_time = datetime.strptime(start_date, "%Y%m%d")
+        end_time = datetime.strptime(end_date, "%Y%m%d")
         return start_time, end_time
 
 
@@ -259,6 +286,9 @@ class AncillaryInput(ProcessingInput):
     and descriptor.
     """
 
+    __slots__ = ()
+    _file_path_class = AncillaryFilePath
+
     # Can contain multiple ancillary files - should have the same descriptor
     def __init__(self, *args):
         """Set the processing type to AncillaryFile and then calls super().
@@ -284,20 +314,14 @@ class AncillaryInput(ProcessingInput):
         (start_time, end_time) : tuple[datetime]
             A tuple of earliest, end_time describing the time range across all files.
         """
-        start_time = None
-        end_time = None
-        for file in self.filename_list:
-            filepath = AncillaryFilePath(file)
-            startdate = datetime.strptime(filepath.start_date, "%Y%m%d")
-            if filepath.end_date is not None:
-                enddate = datetime.strptime(filepath.end_date, "%Y%m%d")
-            else:
-                enddate = startdate
-
-            if start_time is None or startdate < start_time:
-                start_time = startdate
-            if end_time is None or enddate > end_time:
-                end_time = enddate
+        # Compare the date strings as in ScienceInput.get_time_range
+        start_date = min(filepath.start_date for filepath in self.imap_file_paths)
+        end_date = max(
+            filepath.end_date or filepath.start_date
+            for filepath in self.imap_file_paths
+        )
+        start_time = datetime.strptime(start_date, "%Y%m%d")
+        end_time = datetime.strptime(end_date, "%Y%m%d")
 
         return start_time, end_time
 
@@ -333,7 +357,7 @@ class SPICEInput(ProcessingInput):
         file_obj_list = []
 
         for file in self.filename_list:
-            path_validator = SPICEFilePath(file)
+            path_validator = _parse_file_path(SPICEFilePath, file)
             kernel_type = path_validator.spice_metadata["type"]
             if kernel_type in {"spin", "repoint"}:
                 raise ProcessingInput.ProcessingInputError(
@@ -375,7 +399,7 @@ class SpinInput(ProcessingInput):
         file_obj_list = []
 
         for file in self.filename_list:
-            path_validator = SPICEFilePath(file)
+            path_validator = _parse_file_path(SPICEFilePath, file)
             kernel_type = path_validator.spice_metadata["type"]
             if kernel_type != "spin":
                 raise ProcessingInput.ProcessingInputError(
@@ -409,7 +433,9 @@ class RepointInput(ProcessingInput):
                 "RepointInput can only contain one repoint file."
             )
 
-        file_obj_list = [SPICEFilePath(file) for file in self.filename_list]
+        file_obj_list = [
+            _parse_file_path(SPICEFilePath, file) for file in self.filename_list
+        ]
         self.imap_file_paths = file_obj_list
 
     def construct_json_output(self):
@@ -421,7 +447,16 @@ class RepointInput(ProcessingInput):
         pass
 
 
-@dataclass
+# Map the serialized "type" of each input to the class used to deserialize it
+_INPUT_TYPE_CLASSES = {
+    ProcessingInputType.SCIENCE_FILE.value: ScienceInput,
+    ProcessingInputType.ANCILLARY_FILE.value: AncillaryInput,
+    ProcessingInputType.SPICE_FILE.value: SPICEInput,
+    SPICESource.SPIN.value: SpinInput,
+    SPICESource.REPOINT.value: RepointInput,
+}
+
+
 class ProcessingInputCollection:
     """Describe a collection of ProcessingInput objects.
 
@@ -439,6 +474,8 @@ class ProcessingInputCollection:
 
     processing_input: list[ProcessingInput]
 
+    __slots__ = ("processing_input",)
+
     def __init__(self, *args: ProcessingInput) -> None:
         """Initialize the collection with the inputs.
 
@@ -472,11 +509,9 @@ class ProcessingInputCollection:
         str
             A string of JSON-formatted serialized output.
         """
-        json_out = []
-        for file in self.processing_input:
-            json_out.append(file.construct_json_output())
-
-        return json.dumps(json_out)
+        return json.dumps(
+            [file.construct_json_output() for file in self.processing_input]
+        )
 
     def deserialize(self, json_input: str) -> None:
         """Deserialize JSON into the collection of ProcessingInput instances.
@@ -494,20 +529,25 @@ class ProcessingInputCollection:
                 {"type": "science", "files": [<list of science files>]},
                 {"type": "ancillary", "files": [<list of ancillary files>]}
             ]
+
+        Raises
+        ------
+        ProcessingInput.ProcessingInputError
+            If an input has a "type" that isn't a known processing input type.
+            No inputs are added to the collection in that case.
         """
         full_input = json.loads(json_input)
 
+        # Build all the inputs first so they are added with a single extend
+        inputs = []
         for file_creator in full_input:
-            if file_creator["type"] == ProcessingInputType.SCIENCE_FILE.value:
-                self.add(ScienceInput(*file_creator["files"]))
-            elif file_creator["type"] == ProcessingInputType.ANCILLARY_FILE.value:
-                self.add(AncillaryInput(*file_creator["files"]))
-            elif file_creator["type"] == ProcessingInputType.SPICE_FILE.value:
-                self.add(SPICEInput(*file_creator["files"]))
-            elif file_creator["type"] == SPICESource.SPIN.value:
-                self.add(SpinInput(*file_creator["files"]))
-            elif file_creator["type"] == SPICESource.REPOINT.value:
-                self.add(RepointInput(*file_creator["files"]))
+            input_class = _INPUT_TYPE_CLASSES.get(file_creator["type"])
+            if input_class is None:
+                raise ProcessingInput.ProcessingInputError(
+                    f"Unknown processing input type: {file_creator['type']!r}"
+                )
+            inputs.append(input_class(*file_creator["files"]))
+        self.add(inputs)
 
     def get_science_inputs(self, source: str | None = None) -> list[ProcessingInput]:
         """Return just the science files from the collection.
@@ -14,9 +14,11 @@ Location of list of APIDs and associated instruments:
 https://lasp.colorado.edu/galaxy/spaces/IMAP/pages/155648242/Packet+Decommutation+Resource+Page+-+IMAP
 """
 
+import bisect
 import csv
 import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
@@ -32,6 +34,8 @@ WEBPODA_APID_URL = "https://lasp.colorado.edu/ops/imap/poda/dap2/apids"
 # SID2 == FLIGHT instrument telemetry and spacecraft telemetry before launch
 # SID3 == Instrument simulator telemetry and spacecraft simulator telemetry
 SYSTEM_ID = "SID2"
+# Maximum number of concurrent APID requests made to webpoda
+MAX_WORKERS = 8
 
 # https://lasp.colorado.edu/galaxy/spaces/IMAP/pages/155648242/Packet+Decommutation+Resource+Page+-+IMAP
 INSTRUMENT_APIDS = {
@@ -199,10 +203,9 @@ def get_packet_times_ert(
 
     # Iterate over each line in the response, converting them to dates.
     # We first strip the line to remove any whitespace (\r) and skip any trailing lines
+    # The times are ISO 8601, so use fromisoformat rather than the much slower strptime
     return [
-        datetime.datetime.strptime(line.strip(), "%Y-%m-%dT%H:%M:%S")
-        for line in data
-        if line.strip()
+        datetime.datetime.fromisoformat(line) for line in map(str.strip, data) if line
     ]
 
 
@@ -252,6 +255,44 @@ def get_packet_binary_data_sctime(
         return response.content
 
 
+def _get_binary_data_for_apids(
+    apids: list[int], start_time: datetime.datetime, end_time: datetime.datetime
+) -> bytes:
+    """Get the concatenated binary packet data for all apids in the time range.
+
+    Each APID is an independent webpoda request, so they are made concurrently
+    and joined back together in the order of ``apids``. If a request fails, the
+    requests that haven't started yet are cancelled, but any already in flight are
+    allowed to finish before the error is raised.
+
+    Parameters
+    ----------
+    apids : list[int]
+        The APIDs to query for.
+    start_time : datetime.datetime
+        The start time of the query in Spacecraft Time (SCT).
+    end_time : datetime.datetime
+        The end time of the query in Spacecraft Time (SCT).
+
+    Returns
+    -------
+    bytes
+        The binary packet data for all APIDs between the start and end time.
+    """
+    if not apids:
+        return b""
+
+    # NOTE: executor.map cancels its remaining futures when a result raises, so a
+    #       failed request stops any queued requests from being made
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(apids))) as executor:
+        return b"".join(
+            executor.map(
+                lambda apid: get_packet_binary_data_sctime(apid, start_time, end_time),
+                apids,
+            )
+        )
+
+
 def download_daily_data(
     instrument: str,
     start_time: datetime.datetime,
@@ -315,13 +356,10 @@ def download_daily_data(
         daily_start_time = datetime.datetime.combine(date, datetime.time.min)
         daily_end_time = datetime.datetime.combine(date, datetime.time.max)
 
-        # Iterate over all apids, downloading the content for this time period
+        # Download the content of all apids for this time period,
         # concatenating all the binary returns into a single binary file
-        daily_packet_content = b"".join(
-            [
-                get_packet_binary_data_sctime(apid, daily_start_time, daily_end_time)
-                for apid in apids
-            ]
+        daily_packet_content = _get_binary_data_for_apids(
+            apids, daily_start_time, daily_end_time
         )
 
         logger.info(
@@ -388,6 +426,20 @@ def download_repointing_data(  # noqa: PLR0913
     logger.debug(
         f"Repointing file [{repointing_file}] contains [{len(repointings)}] rows"
     )
+    # Parse each repointing end time once up front rather than once per pointing edge.
+    # An unfinished repointing maneuver has a NaN end time, which is stored as None.
+    repoint_end_times = [
+        None
+        if row["repoint_end_utc"].lower() == "nan"
+        else datetime.datetime.strptime(row["repoint_end_utc"], "%Y-%m-%d %H:%M:%S.%f")
+        for row in repointings
+    ]
+    # Only the trailing repointings can be unfinished, any missing end times before
+    # the last complete repointing mean the file itself is bad
+    last_complete_index = max(
+        (i for i, end_time in enumerate(repoint_end_times) if end_time is not None),
+        default=-1,
+    )
 
     apids = INSTRUMENT_APIDS[instrument]
     logger.info(f"Downloading data for instrument [{instrument}]")
@@ -415,11 +467,22 @@ def download_repointing_data(  # noqa: PLR0913
     # NOTE: We iterate over the repointings rather than the packet times because it is
     #       assumed to be the shorter list (1/day vs 1000s of packets/day per apid)
     for i in range(len(repointings) - 1):
-        pointing_start = datetime.datetime.strptime(
-            repointings[i]["repoint_end_utc"], "%Y-%m-%d %H:%M:%S.%f"
-        )
-        if repointings[i + 1]["repoint_end_utc"].lower() == "nan":
+        pointing_start = repoint_end_times[i]
+        next_repoint_end = repoint_end_times[i + 1]
+        if pointing_start is None or next_repoint_end is None:
             # Missing repointing end time, so it isn't a complete "pointing" yet.
+            if next_repoint_end is None and i + 1 < last_complete_index:
+                # Warn once per bad row, when it is the end of the pointing
+                next_complete_end = next(
+                    end_time
+                    for end_time in repoint_end_times[i + 2 :]
+                    if end_time is not None
+                )
+                logger.warning(
+                    f"Repointing [{repointings[i + 1]['repoint_id']}] is missing its "
+                    "end time but is followed by complete repointings, skipping "
+                    f"packets between {pointing_start} and {next_complete_end}"
+                )
             continue
         if pointing_start > packet_times[-1]:
             # This pointing is after the last packet time, so skip it
@@ -432,9 +495,7 @@ def download_repointing_data(  # noqa: PLR0913
         #       are not double grabbing packets into the pointings.
         #       The times included are [repointing_start, repointing_end), exclusive
         #       on the right edge
-        pointing_end = datetime.datetime.strptime(
-            repointings[i + 1]["repoint_end_utc"], "%Y-%m-%d %H:%M:%S.%f"
-        ) - datetime.timedelta(seconds=1)
+        pointing_end = next_repoint_end - datetime.timedelta(seconds=1)
         if pointing_end < packet_times[0]:
             # This pointing is before the first packet time, so skip it
             logger.debug(
@@ -442,7 +503,11 @@ def download_repointing_data(  # noqa: PLR0913
                 f"{packet_times[0]}, skipping"
             )
             continue
-        if not any(pointing_start <= p_time <= pointing_end for p_time in packet_times):
+        # packet_times is sorted, so binary search for the first packet at or after
+        # the pointing start instead of scanning every packet. The pointing start is
+        # not after the last packet (checked above), so this index is always valid.
+        first_packet = bisect.bisect_left(packet_times, pointing_start)
+        if packet_times[first_packet] > pointing_end:
             # This pointing didn't contain any packets within it
             logger.debug(
                 f"Pointing start {pointing_start} and end {pointing_end} "
@@ -468,13 +533,10 @@ def download_repointing_data(  # noqa: PLR0913
             logger.info(f"Skipping {path} because it already exists.")
             continue
 
-        # Iterate over all apids, downloading the content for this time period
+        # Download the content of all apids for this time period,
         # concatenating all the binary returns into a single binary file
-        pointing_packet_content = b"".join(
-            [
-                get_packet_binary_data_sctime(apid, pointing_start, pointing_end)
-                for apid in apids
-            ]
+        pointing_packet_content = _get_binary_data_for_apids(
+            apids, pointing_start, pointing_end
         )
 
         logger.info(
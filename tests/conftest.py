@@ -19,19 +19,35 @@ def _set_global_config(monkeypatch: pytest.fixture, tmp_path: pytest.fixture):
     monkeypatch.setitem(imap_data_access.config, "WEBPODA_TOKEN", "test_token")
 
 
-@pytest.fixture(autouse=True)
-def mock_send_request():
-    """Mock session to return a requests-like object.
+@pytest.fixture(scope="session")
+def _mock_session():
+    """Patch the requests session once for the whole test run.
+
+    Building the MagicMock tree is comparatively expensive, so it is shared between
+    tests and reset by ``mock_send_request`` instead.
 
     Yields
     ------
+    mock_session_instance : unittest.mock.MagicMock
+        Mock object for the session returned by ``requests.Session()``
+    """
+    with patch("requests.Session") as mock_session:
+        yield mock_session.return_value.__enter__.return_value
+
+
+@pytest.fixture(autouse=True)
+def mock_send_request(_mock_session):
+    """Mock session to return a requests-like object.
+
+    Returns
+    -------
     mock_send_request : unittest.mock.MagicMock
         Mock object for ``session.send()``
     """
-    with patch("requests.Session") as mock_session:
-        mock_session_instance = mock_session.return_value.__enter__.return_value
-        mock_session_instance.send.return_value.content = b"Mock file content"
-        yield mock_session_instance.send
+    # Clear any calls and configuration left over from the previous test
+    _mock_session.send.reset_mock(return_value=True, side_effect=True)
+    _mock_session.send.return_value.content = b"Mock file content"
+    return _mock_session.send
 
 
 @pytest.fixture
@@ -1,5 +1,6 @@
 """Tests for the ``file_validation`` module."""
 
+import re
 from datetime import datetime
 from pathlib import Path
 
@@ -26,6 +27,8 @@ def test_extract_filename_components():
         "data_level": "l1a",
         "descriptor": "burst",
         "start_date": "20210101",
+        "start_year": "2021",
+        "start_month": "01",
         "repointing": None,
         "cr": None,
         "version": "v001",
@@ -88,9 +91,15 @@ def test_construct_sciencefilepathmanager():
     with pytest.raises(ScienceFilePath.InvalidImapFileError):
         ScienceFilePath(invalid_filename)
 
-    # invalid instrument
+    # invalid instrument, listing the valid choices in the message
     invalid_filename = "imap_sdc_l1a_burst_20210101_v001.cdf"
-    with pytest.raises(ScienceFilePath.InvalidImapFileError):
+    valid_instruments = ", ".join(sorted(imap_data_access.VALID_INSTRUMENTS))
+    with pytest.raises(
+        ScienceFilePath.InvalidImapFileError,
+        match=re.escape(
+            f"Invalid instrument sdc. Please choose from {valid_instruments} \n"
+        ),
+    ):
         ScienceFilePath(invalid_filename)
 
     # Bad repointing, not 5 digits
@@ -129,6 +138,23 @@ def test_is_valid_date():
     invalid_date = "2021010"
     assert not ScienceFilePath.is_valid_date(invalid_date)
 
+    # Leap years
+    assert ScienceFilePath.is_valid_date("20240229")
+    assert ScienceFilePath.is_valid_date("20000229")
+    assert not ScienceFilePath.is_valid_date("20230229")
+    assert not ScienceFilePath.is_valid_date("21000229")
+
+
+def test_is_valid_version():
+    """Tests the ``is_valid_version`` method."""
+    assert ScienceFilePath.is_valid_version("v001")
+    assert ScienceFilePath.is_valid_version("latest")
+
+    assert not ScienceFilePath.is_valid_version("v01")
+    assert not ScienceFilePath.is_valid_version("v0001")
+    assert not ScienceFilePath.is_valid_version("001")
+    assert not ScienceFilePath.is_valid_version("v0a1")
+
 
 def test_construct_upload_path():
     """Tests the ``construct_path`` method."""
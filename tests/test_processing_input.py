@@ -1,5 +1,6 @@
 import json
 from datetime import datetime
+from pathlib import Path
 
 import pytest
 
@@ -54,6 +55,26 @@ def test_create_science_files():
             "imap_mag_l1a_norm-magi_20240312_v000.cdf",
         )
 
+    with pytest.raises(ProcessingInput.ProcessingInputError, match="same source"):
+        processing_input.ScienceInput(
+            "imap_mag_l1a_norm-magi_20240312_v000.cdf",
+            "imap_mag_l1b_norm-magi_20240312_v000.cdf",
+        )
+
+    with pytest.raises(ProcessingInput.ProcessingInputError, match="At least one"):
+        processing_input.ScienceInput()
+
+    with pytest.raises(ProcessingInput.ProcessingInputError, match="must be strings"):
+        processing_input.ScienceInput(
+            Path("imap_mag_l1a_norm-magi_20240312_v000.cdf"),
+        )
+
+    # Parsed file paths are shared between inputs with the same filename
+    same_file = processing_input.ScienceInput(
+        "imap_mag_l1a_norm-magi_20240312_v000.cdf"
+    )
+    assert same_file.imap_file_paths[0] is one_file.imap_file_paths[0]
+
 
 def test_create_ancillary_files():
     one_file = processing_input.AncillaryInput("imap_mag_l1b-cal_20250101_v001.cdf")
@@ -344,6 +365,18 @@ def test_create_collection():  # noqa: PLR0915
     assert len(input_collection.processing_input) == 1
     assert len(input_collection.get_file_paths(data_type="spice")) == 2
 
+    # Unknown input types are rejected rather than silently dropped
+    input_collection_str = [
+        {"type": "unknown", "files": ["imap_swe_l0_raw_20260924_v007.pkts"]},
+    ]
+    input_collection = processing_input.ProcessingInputCollection()
+    with pytest.raises(
+        ProcessingInput.ProcessingInputError,
+        match="Unknown processing input type: 'unknown'",
+    ):
+        input_collection.deserialize(json.dumps(input_collection_str))
+    assert len(input_collection.processing_input) == 0
+
 
 def test_get_time_range():
     ancillary = processing_input.AncillaryInput(
@@ -356,6 +389,17 @@ def test_get_time_range():
     assert start == datetime.strptime("20250101", "%Y%m%d")
     assert end == datetime.strptime("20250104", "%Y%m%d")
 
+    science = processing_input.ScienceInput(
+        "imap_mag_l1a_norm-magi_20240312_v000.cdf",
+        "imap_mag_l1a_norm-magi_20240310_v000.cdf",
+        "imap_mag_l1a_norm-magi_20240311_v000.cdf",
+    )
+
+    start, end = science.get_time_range()
+
+    assert start == datetime(2024, 3, 10)
+    assert end == datetime(2024, 3, 12)
+
 
 def test_get_file_paths():
     # This example is fake example where we are processing HIT L2
@@ -1,5 +1,7 @@
 import datetime
-from unittest.mock import MagicMock, patch
+import logging
+import time
+from unittest.mock import patch
 
 import pytest
 
@@ -8,6 +10,7 @@ from imap_data_access import ScienceFilePath
 from imap_data_access.io import IMAPDataAccessError
 from imap_data_access.webpoda import (
     INSTRUMENT_APIDS,
+    _get_binary_data_for_apids,
     _get_webpoda_headers,
     download_daily_data,
     download_repointing_data,
@@ -26,9 +29,7 @@ def test_get_webpoda_headers(monkeypatch):
 
 
 def test_get_packet_times_ert(mock_send_request, mock_request):
-    mock_response = MagicMock()
-    mock_response.text = "2024-12-01T00:00:00\n2024-12-01T00:00:01\n"
-    mock_send_request.return_value = mock_response
+    mock_send_request.return_value.text = "2024-12-01T00:00:00\n2024-12-01T00:00:01\n"
 
     start_time = datetime.datetime(2024, 12, 1, 0, 0, 0)
     end_time = datetime.datetime(2024, 12, 1, 23, 59, 59)
@@ -55,9 +56,7 @@ def test_get_packet_times_ert(mock_send_request, mock_request):
 
 
 def test_get_packet_binary_data_sctime(mock_send_request, mock_request):
-    mock_response = MagicMock()
-    mock_response.content = b"\x00\x01\x02\x03"
-    mock_send_request.return_value = mock_response
+    mock_send_request.return_value.content = b"\x00\x01\x02\x03"
 
     start_time = datetime.datetime(2024, 12, 1, 0, 0, 0)
     end_time = datetime.datetime(2024, 12, 1, 23, 59, 59)
@@ -81,6 +80,49 @@ def test_get_packet_binary_data_sctime(mock_send_request, mock_request):
     assert result == b"\x00\x01\x02\x03"
 
 
+@patch("imap_data_access.webpoda.get_packet_binary_data_sctime")
+def test_get_binary_data_for_apids(mock_get_packet_binary_data_sctime):
+    """Test that the concurrent downloads are joined in apid order."""
+    mock_get_packet_binary_data_sctime.side_effect = lambda apid, start, end: bytes(
+        [apid]
+    )
+    start_time = datetime.datetime(2024, 12, 1, 0, 0, 0)
+    end_time = datetime.datetime(2024, 12, 1, 23, 59, 59)
+    apids = list(range(20))
+
+    result = _get_binary_data_for_apids(apids, start_time, end_time)
+
+    assert result == bytes(apids)
+    assert mock_get_packet_binary_data_sctime.call_count == len(apids)
+
+    # No apids means no requests and no data
+    mock_get_packet_binary_data_sctime.reset_mock()
+    assert _get_binary_data_for_apids([], start_time, end_time) == b""
+    mock_get_packet_binary_data_sctime.assert_not_called()
+
+
+@patch("imap_data_access.webpoda.MAX_WORKERS", 1)
+@patch("imap_data_access.webpoda.get_packet_binary_data_sctime")
+def test_get_binary_data_for_apids_error(mock_get_packet_binary_data_sctime):
+    """Test that a failed download cancels the requests that haven't started."""
+
+    def get_data(apid, start, end):
+        if apid == 0:
+            raise IMAPDataAccessError("Download failed")
+        # Keep the worker busy so the remaining requests are still queued
+        time.sleep(0.05)
+        return bytes([apid])
+
+    mock_get_packet_binary_data_sctime.side_effect = get_data
+    start_time = datetime.datetime(2024, 12, 1, 0, 0, 0)
+    end_time = datetime.datetime(2024, 12, 1, 23, 59, 59)
+    apids = list(range(20))
+
+    with pytest.raises(IMAPDataAccessError, match="Download failed"):
+        _get_binary_data_for_apids(apids, start_time, end_time)
+    assert mock_get_packet_binary_data_sctime.call_count < len(apids)
+
+
 @patch("imap_data_access.webpoda.get_packet_binary_data_sctime")
 @patch("imap_data_access.webpoda.get_packet_times_ert")
 @patch("imap_data_access.webpoda.imap_data_access.upload")
@@ -128,12 +170,13 @@ def test_download_daily_data(
 @patch("imap_data_access.webpoda.get_packet_times_ert")
 @patch("imap_data_access.webpoda.imap_data_access.upload")
 @pytest.mark.parametrize("upload_to_server", [True, False])
-def test_download_repointing_data(
+def test_download_repointing_data(  # noqa: PLR0913, PLR0917
     mock_upload,
     mock_get_packet_times_ert,
     mock_get_packet_binary_data_sctime,
     upload_to_server,
     tmpdir,
+    caplog,
 ):
     # We are mocking the upload, lets also verify that
     # duplicate files don't propagate any errors.
@@ -151,10 +194,18 @@ def test_download_repointing_data(
             # One packet per pointing period
             "0,0,1,0,2024-11-30 00:00:00.000,2024-11-30 20:15:00.000,1\n"
             "0,0,1,0,2024-12-01 00:00:00.000,2024-12-01 00:15:00.000,2\n"
-            "10,0,11,0,2024-12-02 00:00:00.000,2024-12-02 00:15:00.000,3\n"
+            "0,0,1,0,2024-12-01 05:45:00.000,2024-12-01 06:00:00.000,3\n"
+            # No packets between the end of repointing 3 and the end of repointing 4,
+            # even though there are packets before and after that pointing
+            "0,0,1,0,2024-12-01 11:45:00.000,2024-12-01 12:00:00.000,4\n"
+            "10,0,11,0,2024-12-02 00:00:00.000,2024-12-02 00:15:00.000,5\n"
+            # A repointing missing its end time in the middle of the file leaves both
+            # the pointing before it and the one starting from it incomplete
+            "10,0,NaN,NaN,2024-12-02 06:00:00.000,NaN,6\n"
+            "10,0,11,0,2024-12-02 12:15:00.000,2024-12-02 12:30:00.000,7\n"
             # An unfinished repointing maneuver may have NaNs in the end times
             # Make sure we can handle this and ignore it
-            "10,0,NaN,NaN,2024-12-03T00:00:00.000000,NaN,4\n"
+            "10,0,NaN,NaN,2024-12-03T00:00:00.000000,NaN,8\n"
         )
 
     start_time = datetime.datetime(2024, 12, 1, 0, 0, 0)
@@ -173,12 +224,16 @@ def test_download_repointing_data(
     assert not (imap_data_access.config["DATA_DIR"] / "imap").exists()
 
     # Now test with some returned packets
+    caplog.clear()
     mock_get_packet_times_ert.return_value = [
         datetime.datetime(2024, 12, 1, 0, 0, 0),
         # This packet is right on a pointing boundary, it shouldn't be
         # in both files but only the second one.
         datetime.datetime(2024, 12, 1, 0, 15, 0),
-        # This packet is after valid repointings in the file and shouldn't be counted
+        # This packet is in the pointing after the empty one (repoint_id 4)
+        datetime.datetime(2024, 12, 1, 18, 0, 0),
+        # This packet is in the incomplete pointings around the missing end time of
+        # repoint_id 6, so it shouldn't be counted
         datetime.datetime(2024, 12, 2, 12, 0, 0),
     ]
     download_repointing_data(
@@ -189,9 +244,9 @@ def test_download_repointing_data(
         upload_to_server=upload_to_server,
     )
 
-    # We expect two repointing files to be created because we have packets
-    # across two separate repointing periods
-    for repoint_id, date in [(1, "20241130"), (2, "20241201")]:
+    # We expect three repointing files to be created because we have packets
+    # across three separate repointing periods
+    for repoint_id, date in [(1, "20241130"), (2, "20241201"), (4, "20241201")]:
         expected_file_path = ScienceFilePath.generate_from_inputs(
             instrument=instrument,
             data_level="l0",
@@ -205,3 +260,23 @@ def test_download_repointing_data(
         assert expected_file_path.read_bytes() == b"\x00\x01\x02\x03" * n_apids
         assert mock_upload.called is upload_to_server
     assert (imap_data_access.config["DATA_DIR"] / "imap").exists()
+
+    # The pointing without any packets in it shouldn't produce a file
+    assert not list(imap_data_access.config["DATA_DIR"].rglob("*-repoint00003_*"))
+    # Neither of the pointings next to the missing end time should produce a file
+    for repoint_id in (5, 6):
+        assert not list(
+            imap_data_access.config["DATA_DIR"].rglob(f"*-repoint{repoint_id:05d}_*")
+        )
+    # The missing end time in the middle of the file is reported, but not the
+    # unfinished repointing at the end of the file
+    warnings = [
+        record.getMessage()
+        for record in caplog.records
+        if record.levelno == logging.WARNING
+    ]
+    assert warnings == [
+        "Repointing [6] is missing its end time but is followed by complete "
+        "repointings, skipping packets between 2024-12-02 00:15:00 and "
+        "2024-12-02 12:30:00"
+    ]